@@ -4,6 +4,103 @@ const fs = require('fs');
 const path = require('path');
 const crypto = require('crypto');
 
+// Slug normalization patterns (compiled once at module load)
+const SLUG_SEPARATOR_RUN_PATTERN = /[^a-z0-9]+/g;
+const SLUG_EDGE_HYPHEN_PATTERN = /^-|-$/g;
+
+// Content transformation patterns
+// A fence is either tagged with a language or, if untagged, may open a Mermaid diagram
+const CODE_FENCE_PATTERN = /```(?:(\w+)|\n(graph|flowchart|sequenceDiagram|classDiagram|gitgraph))/g;
+const MARKDOWN_IMAGE_PATTERN = /!\[([^\]]+)\]\((?!PLACEHOLDER:)([^)]+)\)/g;
+
+// Metadata validation rules
+const REQUIRED_METADATA_FIELDS = Object.freeze([
+  'title', 'slug', 'uniqueId', 'category', 'subcategory',
+  'description', 'tags', 'difficulty', 'readTime'
+]);
+const UNIQUE_ID_PATTERN = /^[a-f0-9]{8}$/;
+const VALID_DIFFICULTIES = new Set(['beginner', 'intermediate', 'advanced']);
+
+// Code block language mappings (matches upstream)
+const LANGUAGE_MAPPINGS = Object.freeze({
+  'js': 'javascript',
+  'jsx': 'jsx',
+  'ts': 'typescript',
+  'tsx': 'tsx',
+  'py': 'python',
+  'python3': 'python',
+  'sh': 'bash',
+  'shell': 'bash',
+  'zsh': 'bash',
+  'cmd': 'powershell',
+  'yml': 'yaml',
+  'yaml': 'yaml',
+  'dockerfile': 'docker',
+  'html': 'html',
+  'css': 'css',
+  'scss': 'scss',
+  'sql': 'sql',
+  'json': 'json',
+  'xml': 'xml',
+  'md': 'markdown',
+  'markdown': 'markdown',
+  'mermaid': 'mermaid',
+  'text': 'text',
+  'plain': 'text',
+  'txt': 'text',
+  'output': 'output',
+  'console': 'output',
+  'config': 'config',
+  'conf': 'config'
+});
+
+// Category mapping for common mismatches
+const CATEGORY_MAPPINGS = Object.freeze({
+  'programming': 'programming-languages',
+  'devops': 'system-devops',
+  'backend': 'web-backend',
+  'frontend': 'web-frontend',
+  'database': 'databases',
+  'db': 'databases'
+});
+
+// Tag vocabularies used to infer a category, in priority order
+const CATEGORY_TAG_BUCKETS = Object.freeze([
+  // Database-related
+  ['databases', new Set(['sql', 'mysql', 'postgresql', 'mongodb', 'database', 'sql-server', 'oracle', 'sqlite'])],
+  // DevOps/System related
+  ['system-devops', new Set(['docker', 'kubernetes', 'aws', 'azure', 'gcp', 'linux', 'bash', 'shell', 'devops', 'cloud'])],
+  // Frontend related
+  ['web-frontend', new Set(['javascript', 'react', 'vue', 'angular', 'css', 'html', 'frontend', 'ui', 'web'])],
+  // Mobile related
+  ['mobile', new Set(['android', 'ios', 'mobile', 'swift', 'kotlin'])]
+]);
+
+// Map tags to human-readable technology names
+const TECHNOLOGY_MAPPINGS = Object.freeze({
+  'javascript': 'JavaScript',
+  'js': 'JavaScript',
+  'python': 'Python',
+  'py': 'Python',
+  'java': 'Java',
+  'sql': 'SQL',
+  'sql-server': 'SQL Server',
+  'mysql': 'MySQL',
+  'postgresql': 'PostgreSQL',
+  'mongodb': 'MongoDB',
+  'bash': 'Bash',
+  'shell': 'Shell',
+  'linux': 'Linux',
+  'windows': 'Windows',
+  'docker': 'Docker',
+  'aws': 'AWS',
+  'html': 'HTML',
+  'css': 'CSS',
+  'react': 'React',
+  'node': 'Node.js',
+  'npm': 'npm'
+});
+
 /**
  * JSON to MDX Converter for DeepV Code Content Repository
  * Converts JSON files from upstream AI generator to MDX format
@@ -28,50 +125,26 @@ class JsonToMdxConverter {
     };
     
     this.categories = null;
+    this.subcategoryIndex = null;
     this.contentSchema = null;
     this.articleIndex = this.loadArticleIndex();
     this.processedFiles = [];
     this.errorFiles = [];
     
-    // Code block language mappings (matches upstream)
-    this.languageMappings = {
-      'js': 'javascript',
-      'jsx': 'jsx', 
-      'ts': 'typescript',
-      'tsx': 'tsx',
-      'py': 'python',
-      'python3': 'python',
-      'sh': 'bash',
-      'shell': 'bash',
-      'zsh': 'bash',
-      'cmd': 'powershell',
-      'yml': 'yaml',
-      'yaml': 'yaml',
-      'dockerfile': 'docker',
-      'html': 'html',
-      'css': 'css',
-      'scss': 'scss',
-      'sql': 'sql',
-      'json': 'json',
-      'xml': 'xml',
-      'md': 'markdown',
-      'markdown': 'markdown',
-      'mermaid': 'mermaid',
-      'text': 'text',
-      'plain': 'text',
-      'txt': 'text',
-      'output': 'output',
-      'console': 'output', 
-      'config': 'config',
-      'conf': 'config'
-    };
+    this.languageMappings = LANGUAGE_MAPPINGS;
   }
 
   async fetchFromGitHub(url, fallbackPath) {
     try {
       const https = require('https');
-      return new Promise((resolve, reject) => {
+      // Await here so network, HTTP and parse failures all reach the local fallback
+      return await new Promise((resolve, reject) => {
         https.get(url, (response) => {
+          if (response.statusCode !== 200) {
+            response.resume();
+            reject(new Error(`HTTP ${response.statusCode}`));
+            return;
+          }
           let data = '';
           response.on('data', (chunk) => data += chunk);
           response.on('end', () => {
@@ -104,6 +177,7 @@ class JsonToMdxConverter {
         this.config.githubUrls.categories, 
         this.config.categoriesPath
       );
+      this.subcategoryIndex = this.buildSubcategoryIndex(this.categories);
       console.log('✅ Categories loaded successfully');
       return this.categories;
     } catch (error) {
@@ -112,6 +186,14 @@ class JsonToMdxConverter {
     }
   }
 
+  buildSubcategoryIndex(categories) {
+    // Category id -> Set of subcategory ids, so lookups avoid linear scans
+    return new Map(categories.categories.map(cat => [
+      cat.id,
+      new Set(cat.subcategories.map(sub => sub.id))
+    ]));
+  }
+
   async loadContentSchema() {
     if (this.contentSchema) return this.contentSchema;
     
@@ -168,85 +250,62 @@ class JsonToMdxConverter {
   }
 
   mapCategory(category, subcategory, tags = []) {
-    // Category mapping for common mismatches
-    const categoryMappings = {
-      'programming': 'programming-languages',
-      'devops': 'system-devops', 
-      'backend': 'web-backend',
-      'frontend': 'web-frontend',
-      'database': 'databases',
-      'db': 'databases'
-    };
-
     // Smart mapping based on tags and technology
-    if (category === 'programming' || !this.categories.categories.some(cat => cat.id === category)) {
+    if (category === 'programming' || !this.subcategoryIndex.has(category)) {
       const tagLower = tags.map(tag => tag.toLowerCase());
       
-      // Database-related
-      if (tagLower.some(tag => ['sql', 'mysql', 'postgresql', 'mongodb', 'database', 'sql-server', 'oracle', 'sqlite'].includes(tag))) {
-        return 'databases';
-      }
-      
-      // DevOps/System related
-      if (tagLower.some(tag => ['docker', 'kubernetes', 'aws', 'azure', 'gcp', 'linux', 'bash', 'shell', 'devops', 'cloud'].includes(tag))) {
-        return 'system-devops';
-      }
-      
-      // Frontend related
-      if (tagLower.some(tag => ['javascript', 'react', 'vue', 'angular', 'css', 'html', 'frontend', 'ui', 'web'].includes(tag))) {
-        return 'web-frontend';
-      }
-      
-      // Mobile related  
-      if (tagLower.some(tag => ['android', 'ios', 'mobile', 'swift', 'kotlin'].includes(tag))) {
-        return 'mobile';
+      // Buckets are checked in priority order; first match wins
+      for (const [mappedCategory, bucketTags] of CATEGORY_TAG_BUCKETS) {
+        if (tagLower.some(tag => bucketTags.has(tag))) {
+          return mappedCategory;
+        }
       }
     }
 
-    return categoryMappings[category] || category;
+    return CATEGORY_MAPPINGS[category] || category;
   }
 
   mapSubcategory(category, subcategory, tags = []) {
     // If subcategory is 'general', try to map to something more specific
     if (subcategory === 'general') {
-      const tagLower = tags.map(tag => tag.toLowerCase());
+      const tagLower = new Set(tags.map(tag => tag.toLowerCase()));
       
       if (category === 'databases') {
-        if (tagLower.includes('sql-server')) return 'sql';
-        if (tagLower.includes('mysql')) return 'mysql'; 
-        if (tagLower.includes('postgresql')) return 'postgresql';
-        if (tagLower.includes('mongodb')) return 'mongodb';
+        if (tagLower.has('sql-server')) return 'sql';
+        if (tagLower.has('mysql')) return 'mysql'; 
+        if (tagLower.has('postgresql')) return 'postgresql';
+        if (tagLower.has('mongodb')) return 'mongodb';
         return 'sql'; // default for databases
       }
       
       if (category === 'programming-languages') {
         // Map based on tags
-        if (tagLower.some(tag => ['java'].includes(tag))) return 'java';
-        if (tagLower.some(tag => ['python'].includes(tag))) return 'python';
-        if (tagLower.some(tag => ['javascript', 'js', 'npm', 'node'].includes(tag))) return 'javascript';
-        if (tagLower.some(tag => ['c#', 'csharp'].includes(tag))) return 'csharp';
-        if (tagLower.some(tag => ['cpp', 'c++'].includes(tag))) return 'cpp';
-        if (tagLower.some(tag => ['c'].includes(tag))) return 'c';
-        if (tagLower.some(tag => ['go', 'golang'].includes(tag))) return 'go';
-        if (tagLower.some(tag => ['php'].includes(tag))) return 'php';
-        if (tagLower.some(tag => ['ruby'].includes(tag))) return 'ruby';
-        if (tagLower.some(tag => ['rust'].includes(tag))) return 'rust';
+        if (this.hasAnyTag(tagLower, ['java'])) return 'java';
+        if (this.hasAnyTag(tagLower, ['python'])) return 'python';
+        if (this.hasAnyTag(tagLower, ['javascript', 'js', 'npm', 'node'])) return 'javascript';
+        if (this.hasAnyTag(tagLower, ['c#', 'csharp'])) return 'csharp';
+        if (this.hasAnyTag(tagLower, ['cpp', 'c++'])) return 'cpp';
+        if (this.hasAnyTag(tagLower, ['c'])) return 'c';
+        if (this.hasAnyTag(tagLower, ['go', 'golang'])) return 'go';
+        if (this.hasAnyTag(tagLower, ['php'])) return 'php';
+        if (this.hasAnyTag(tagLower, ['ruby'])) return 'ruby';
+        if (this.hasAnyTag(tagLower, ['rust'])) return 'rust';
         
         // For miscellaneous programming that doesn't fit - default to python
         return 'python';
       }
       
       if (category === 'system-devops') {
-        if (tagLower.some(tag => ['linux', 'bash', 'shell'].includes(tag))) return 'linux';
-        if (tagLower.some(tag => ['docker', 'container'].includes(tag))) return 'containerization';
-        if (tagLower.some(tag => ['aws', 'azure', 'gcp', 'cloud'].includes(tag))) return 'cloud';
-        if (tagLower.some(tag => ['git', 'github', 'gitlab'].includes(tag))) return 'version-control';
+        if (this.hasAnyTag(tagLower, ['linux', 'bash', 'shell'])) return 'linux';
+        if (this.hasAnyTag(tagLower, ['docker', 'container'])) return 'containerization';
+        if (this.hasAnyTag(tagLower, ['aws', 'azure', 'gcp', 'cloud'])) return 'cloud';
+        if (this.hasAnyTag(tagLower, ['git', 'github', 'gitlab'])) return 'version-control';
         return 'shell'; // default
       }
       
       if (category === 'web-frontend') {
-        if (tagLower.some(tag => ['css'].includes(tag))) return 'css';
-        if (tagLower.some(tag => ['html'].includes(tag))) return 'html';
+        if (this.hasAnyTag(tagLower, ['css'])) return 'css';
+        if (this.hasAnyTag(tagLower, ['html'])) return 'html';
         return 'javascript'; // default
       }
     }
@@ -254,6 +313,11 @@ class JsonToMdxConverter {
     return subcategory;
   }
 
+  hasAnyTag(tagSet, candidates) {
+    // Set lookups keep each vocabulary check linear in the candidate list
+    return candidates.some(candidate => tagSet.has(candidate));
+  }
+
   generateUniqueId(stackoverflowId) {
     // SHA256-based unique ID generation (matches upstream algorithm)
     const salt = "deepv-content-2025";
@@ -262,22 +326,21 @@ class JsonToMdxConverter {
   }
 
   processCodeBlocks(content) {
-    // Apply language mappings to code blocks for better syntax highlighting
-    let processedContent = content.replace(/```(\w+)/g, (match, language) => {
-      const mappedLanguage = this.languageMappings[language.toLowerCase()] || language.toLowerCase();
-      return '```' + mappedLanguage;
+    // Single pass: apply language mappings to tagged fences for better syntax
+    // highlighting, and tag untagged Mermaid diagrams (basic heuristic)
+    return content.replace(CODE_FENCE_PATTERN, (match, language, diagramType) => {
+      if (diagramType) {
+        return '```mermaid\n' + diagramType;
+      }
+      const normalizedLanguage = language.toLowerCase();
+      return '```' + (this.languageMappings[normalizedLanguage] || normalizedLanguage);
     });
-
-    // Detect potential Mermaid diagrams (basic heuristic)
-    processedContent = processedContent.replace(/```\n(graph|flowchart|sequenceDiagram|classDiagram|gitgraph)/g, '```mermaid\n$1');
-    
-    return processedContent;
   }
 
   processImagePlaceholders(content) {
     // Convert standard markdown images to PLACEHOLDER format for upstream compatibility
     // This helps maintain consistency with the expected schema format
-    return content.replace(/!\[([^\]]+)\]\((?!PLACEHOLDER:)([^)]+)\)/g, '![$1](PLACEHOLDER: $1 - $2)');
+    return content.replace(MARKDOWN_IMAGE_PATTERN, '![$1](PLACEHOLDER: $1 - $2)');
   }
 
   validateJsonStructure(jsonData, filename) {
@@ -330,23 +393,18 @@ class JsonToMdxConverter {
       }
       
       // Required fields validation
-      const requiredFields = [
-        'title', 'slug', 'uniqueId', 'category', 'subcategory', 
-        'description', 'tags', 'difficulty', 'readTime'
-      ];
-      
-      requiredFields.forEach(field => {
+      REQUIRED_METADATA_FIELDS.forEach(field => {
         if (!meta[field]) {
           errors.push(`Missing required metadata field: ${field}`);
         }
       });
 
       // Validate specific field formats
-      if (meta.uniqueId && !/^[a-f0-9]{8}$/.test(meta.uniqueId)) {
+      if (meta.uniqueId && !UNIQUE_ID_PATTERN.test(meta.uniqueId)) {
         errors.push('uniqueId must be 8-character hex string');
       }
 
-      if (meta.difficulty && !['beginner', 'intermediate', 'advanced'].includes(meta.difficulty)) {
+      if (meta.difficulty && !VALID_DIFFICULTIES.has(meta.difficulty)) {
         errors.push('difficulty must be: beginner, intermediate, or advanced');
       }
 
@@ -356,16 +414,14 @@ class JsonToMdxConverter {
 
       // Validate category exists
       if (meta.category) {
-        const categoryExists = this.categories.categories.some(cat => cat.id === meta.category);
-        if (!categoryExists) {
+        const subcategoryIds = this.subcategoryIndex.get(meta.category);
+        if (!subcategoryIds) {
           errors.push(`Invalid category: ${meta.category}`);
         }
         
         // Validate subcategory if category is valid
-        if (categoryExists && meta.subcategory) {
-          const category = this.categories.categories.find(cat => cat.id === meta.category);
-          const subcategoryExists = category.subcategories.some(sub => sub.id === meta.subcategory);
-          if (!subcategoryExists) {
+        if (subcategoryIds && meta.subcategory) {
+          if (!subcategoryIds.has(meta.subcategory)) {
             errors.push(`Invalid subcategory: ${meta.subcategory} for category: ${meta.category}`);
           }
         }
@@ -421,12 +477,11 @@ class JsonToMdxConverter {
   }
 
   normalizeSlug(slug) {
-    // Replace underscores with hyphens and ensure kebab-case
+    // Collapse every run of underscores, hyphens and other invalid
+    // characters into a single hyphen, then trim, to ensure kebab-case
     return slug
-      .replace(/_/g, '-')
-      .replace(/[^a-z0-9-]/g, '-')
-      .replace(/-+/g, '-')
-      .replace(/^-|-$/g, '');
+      .replace(SLUG_SEPARATOR_RUN_PATTERN, '-')
+      .replace(SLUG_EDGE_HYPHEN_PATTERN, '');
   }
 
   formatISODate(dateString) {
@@ -442,18 +497,18 @@ class JsonToMdxConverter {
     }
   }
 
-  generateMdxFrontmatter(metadata) {
-    // Clean and validate fields (v3.2.0: no title length limit)
-    const title = this.truncateTitle(metadata.title);
-    const slug = this.normalizeSlug(metadata.slug);
-    const lastUpdated = this.formatISODate(metadata.generatedAt || metadata.publishedAt);
+  generateMdxFrontmatter(metadata, lastUpdated) {
+    // Expects title and slug already normalized by convertJsonToMdx.
+    // Free-text values are emitted as JSON strings, which are valid YAML
+    // double-quoted scalars with backslashes and quotes escaped.
+    const { title, slug } = metadata;
     
     return `---
-title: "${title.replace(/"/g, '\\"')}"
+title: ${JSON.stringify(title)}
 slug: "${slug}"
 category: "${metadata.category}"
 subcategory: "${metadata.subcategory}"
-description: "${metadata.description.replace(/"/g, '\\"')}"
+description: ${JSON.stringify(metadata.description)}
 tags: ${JSON.stringify(metadata.tags)}
 difficulty: "${metadata.difficulty}"
 readTime: ${metadata.readTime}
@@ -483,7 +538,8 @@ featured: ${metadata.featured || false}
     const mdxPath = path.join(this.config.mdxOutputDir, mdxFilename);
     
     // Generate frontmatter
-    const frontmatter = this.generateMdxFrontmatter(metadata);
+    const lastUpdated = this.formatISODate(metadata.generatedAt || metadata.publishedAt);
+    const frontmatter = this.generateMdxFrontmatter(metadata, lastUpdated);
     
     // Combine frontmatter and content
     const mdxContent = frontmatter + content;
@@ -504,7 +560,7 @@ featured: ${metadata.featured || false}
         tags: metadata.tags,
         difficulty: metadata.difficulty,
         readTime: metadata.readTime,
-        lastUpdated: this.formatISODate(metadata.generatedAt || metadata.publishedAt),
+        lastUpdated,
         featured: metadata.featured || false,
         filename: mdxFilename,
         sourceStackOverflowId: metadata.sourceStackOverflowId,
@@ -517,9 +573,13 @@ featured: ${metadata.featured || false}
   }
 
   updateArticleIndex(newArticles) {
+    // One timestamp for the whole batch instead of one per article
+    const batchTimestamp = new Date().toISOString();
+
     // Remove any existing articles with same slug to avoid duplicates
+    const newSlugs = new Set(newArticles.map(article => article.metadata.slug));
     const existingArticles = this.articleIndex.articles.filter(article => 
-      !newArticles.some(newArticle => newArticle.metadata.slug === article.slug)
+      !newSlugs.has(article.slug)
     );
     
     // Add new articles with proper schema format
@@ -534,21 +594,27 @@ featured: ${metadata.featured || false}
         difficulty: article.metadata.difficulty,
         technology: article.metadata.technology || this.getTechnologyFromTags(article.metadata.tags),
         readTime: article.metadata.readTime,
-        publishedAt: article.metadata.publishedAt || article.metadata.generatedAt || new Date().toISOString(),
+        publishedAt: article.metadata.publishedAt || article.metadata.generatedAt || batchTimestamp,
         featured: article.metadata.featured || false,
         description: article.metadata.description,
         tags: article.metadata.tags,
         filename: `${article.metadata.slug}-${article.metadata.uniqueId}.mdx`,
-        lastUpdated: article.metadata.generatedAt || new Date().toISOString()
+        lastUpdated: article.metadata.generatedAt || batchTimestamp
       }))
     ];
 
-    // Extract unique categories and technologies
-    const categories = [...new Set(updatedArticles.map(article => article.category))].sort();
-    const technologies = [...new Set(updatedArticles.map(article => article.technology).filter(Boolean))].sort();
+    // Extract unique categories and technologies in a single pass
+    const categorySet = new Set();
+    const technologySet = new Set();
+    for (const article of updatedArticles) {
+      categorySet.add(article.category);
+      if (article.technology) technologySet.add(article.technology);
+    }
+    const categories = [...categorySet].sort();
+    const technologies = [...technologySet].sort();
     
     const updatedIndex = {
-      lastUpdated: new Date().toISOString(),
+      lastUpdated: batchTimestamp,
       totalArticles: updatedArticles.length,
       categories: categories,
       technologies: technologies,
@@ -567,33 +633,8 @@ featured: ${metadata.featured || false}
   }
 
   getTechnologyFromTags(tags) {
-    // Map tags to human-readable technology names
-    const technologyMappings = {
-      'javascript': 'JavaScript',
-      'js': 'JavaScript',
-      'python': 'Python',
-      'py': 'Python',
-      'java': 'Java',
-      'sql': 'SQL',
-      'sql-server': 'SQL Server',
-      'mysql': 'MySQL',
-      'postgresql': 'PostgreSQL',
-      'mongodb': 'MongoDB',
-      'bash': 'Bash',
-      'shell': 'Shell',
-      'linux': 'Linux',
-      'windows': 'Windows',
-      'docker': 'Docker',
-      'aws': 'AWS',
-      'html': 'HTML',
-      'css': 'CSS',
-      'react': 'React',
-      'node': 'Node.js',
-      'npm': 'npm'
-    };
-
     for (const tag of tags) {
-      const tech = technologyMappings[tag.toLowerCase()];
+      const tech = TECHNOLOGY_MAPPINGS[tag.toLowerCase()];
       if (tech) return tech;
     }
     
@@ -643,9 +684,8 @@ featured: ${metadata.featured || false}
     console.log('🚀 DeepV Code JSON to MDX Converter');
     console.log('=====================================');
     
-    // Load latest schemas from GitHub
-    await this.loadCategories();
-    await this.loadContentSchema();
+    // Load latest schemas from GitHub (both requests in flight at once)
+    await Promise.all([this.loadCategories(), this.loadContentSchema()]);
     
     // Get all JSON files (excluding metadata files and error files)
     const jsonFiles = fs.readdirSync(this.config.jsonInputDir)
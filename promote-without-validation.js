@@ -16,6 +16,18 @@ function log(color, message) {
   console.log(`${colors[color]}${message}${colors.reset}`);
 }
 
+function moveFile(sourcePath, destPath) {
+  // A rename is a single metadata operation; fall back to copy + unlink
+  // only when staging and production live on different filesystems.
+  try {
+    fs.renameSync(sourcePath, destPath);
+  } catch (error) {
+    if (error.code !== "EXDEV") throw error;
+    fs.copyFileSync(sourcePath, destPath);
+    fs.unlinkSync(sourcePath);
+  }
+}
+
 function main() {
   log("cyan", "🚀 DeepV Code Content Promotion (Skip Validation)");
   log("cyan", "==================================================");
@@ -43,16 +55,14 @@ function main() {
         const sourcePath = path.join(stagingDir, file);
         const destPath = path.join(productionDir, file);
         
-        fs.copyFileSync(sourcePath, destPath);
-        fs.unlinkSync(sourcePath);
+        moveFile(sourcePath, destPath);
         log("green", `  ✅ Promoted: ${file}`);
         promotedCount++;
       }
     }
 
     if (fs.existsSync(stagingConfig)) {
-      fs.copyFileSync(stagingConfig, productionConfig);
-      fs.unlinkSync(stagingConfig);
+      moveFile(stagingConfig, productionConfig);
       log("green", "  ✅ Updated article index");
     }
 